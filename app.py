@@ -1,243 +1,555 @@
 #!/usr/bin/env python3
-import os, re, json, subprocess
+import os, re, sys, json, gzip, fcntl, hashlib, functools, subprocess, threading, atexit
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from typing import Optional
+from time import time, sleep
 from datetime import datetime, timezone
 from zoneinfo import ZoneInfo
 from flask import Flask, request, jsonify, Response
 
+try:
+    import hyperscan  # optional: single-pass multi-pattern log scanning
+except Exception:
+    hyperscan = None
+try:
+    import re2  # optional: linear-time DFA engine for the live-window scan
+except Exception:
+    re2 = None
+try:
+    import orjson  # optional: C-accelerated JSON for state + responses
+except Exception:
+    orjson = None
+
+def _dumps_bytes(obj):
+    return orjson.dumps(obj) if orjson is not None else json.dumps(obj).encode()
+
 app = Flask(__name__)
 
-# ------------------ tiny response cache (avoid overlapping docker logs) ------------------
-_RESP = {'ts': 0.0, 'json': None}
-_RESP_TTL = 2.0
+# ------------------ response cache, pre-warmed by a background poller ------------------
+DEFAULT_CONTAINER = "blockdag-testnet-network"
+_DEFAULT_ARGS = (DEFAULT_CONTAINER, "", 600)
+# keyed by (container, since, tail) so concurrent non-default queries don't
+# thrash the warm default entry
+_RESP_CACHE = {}
+_RESP_CACHE_MAX = 64
+_RESP_TTL = 6.0   # poller refreshes every ~2s, so default-args requests always hit
+_POLL_INTERVAL = 2.0
 
 # ------------------ state (height cache + running totals) ------------------
 STATE_PATH = os.path.join(os.path.dirname(__file__), ".state.json")
-def _state_default():
-    return {"last_seen_ts": None, "last_height": None, "counters": {"mined":0, "processed":0, "sealed":0}}
+
+@dataclass(slots=True)
+class State:
+    # flat slots: one attribute access per counter bump, no nested dict hops
+    mined: int = 0
+    processed: int = 0
+    sealed: int = 0
+    last_seen_ts: Optional[str] = None
+    last_height: Optional[int] = None
+
+    def reset(self):
+        self.mined=self.processed=self.sealed=0
+        self.last_seen_ts=None; self.last_height=None
+
 def load_state():
     try:
-        with open(STATE_PATH,"r") as f:
-            d=json.load(f)
-        s=_state_default()
-        s["last_seen_ts"]=d.get("last_seen_ts")
-        s["last_height"]=d.get("last_height")
-        s["counters"].update(d.get("counters",{}))
-        return s
+        with open(STATE_PATH,"rb") as f:
+            data=f.read()
+        d=orjson.loads(data) if orjson is not None else json.loads(data)
+        c=d.get("counters", d)  # accept the legacy nested layout
+        return State(mined=int(c.get("mined",0) or 0),
+                     processed=int(c.get("processed",0) or 0),
+                     sealed=int(c.get("sealed",0) or 0),
+                     last_seen_ts=d.get("last_seen_ts"),
+                     last_height=d.get("last_height"))
     except Exception:
-        return _state_default()
+        return State()
+_SAVE_LOCK=threading.Lock()
 def save_state(s):
+    # thread lock for in-process callers, flock for sibling gunicorn workers
     try:
-        tmp=STATE_PATH+".tmp"
-        with open(tmp,"w") as f: json.dump(s,f)
-        os.replace(tmp,STATE_PATH)
+        with _SAVE_LOCK:
+            with open(STATE_PATH+".lock","w") as lk:
+                fcntl.flock(lk, fcntl.LOCK_EX)
+                try:
+                    tmp=STATE_PATH+".tmp"
+                    with open(tmp,"wb") as f: f.write(_dumps_bytes(asdict(s)))
+                    os.replace(tmp,STATE_PATH)
+                finally:
+                    fcntl.flock(lk, fcntl.LOCK_UN)
     except Exception:
         pass
 
+# state lives in memory; disk is only a crash backstop. flush_state just marks
+# the state dirty and a background thread coalesces writes to one every
+# _FLUSH_EVERY seconds, off the request/poller threads entirely
+_STATE=load_state()
+_FLUSH_EVERY=5.0
+_DIRTY=[False]
+def flush_state(force=False):
+    if force:
+        _DIRTY[0]=False
+        save_state(_STATE)
+    else:
+        _DIRTY[0]=True
+
+def _flush_loop():
+    while True:
+        sleep(_FLUSH_EVERY)
+        if _DIRTY[0]:
+            _DIRTY[0]=False
+            save_state(_STATE)
+
+threading.Thread(target=_flush_loop, daemon=True).start()
+atexit.register(lambda: save_state(_STATE))
+
 # ------------------ docker helpers (no sudo) ------------------
 def docker_cmd(): return ["docker"]
-def container_exists(dcmd, name):
+
+# with threaded WSGI workers, a burst of polls could fork a docker CLI per
+# thread; cap the short-lived forks (the -f follower stream is exempt)
+_DOCKER_SEM=threading.Semaphore(4)
+
+_INSPECT_CACHE={}      # name -> (exists, started_at, ts); containers restart rarely
+_INSPECT_TTL=60.0
+_INSPECT_NEG_TTL=10.0  # re-probe missing containers sooner so new ones show up
+
+def inspect_container(dcmd, name):
+    # one O(1) inspect instead of listing every container; also yields StartedAt
+    # so the request path doesn't need a second fork
+    hit=_INSPECT_CACHE.get(name)
+    if hit and time()-hit[2]<=(_INSPECT_TTL if hit[0] else _INSPECT_NEG_TTL):
+        return hit[0], hit[1]
+    exists, started=_inspect_container_uncached(dcmd, name)
+    _INSPECT_CACHE[name]=(exists, started, time())
+    return exists, started
+
+def _inspect_container_uncached(dcmd, name):
     try:
-        out=subprocess.check_output(dcmd+["ps","-a","--format","{{.Names}}"], text=True)
-        return any(line.strip()==name for line in out.splitlines())
-    except Exception: return False
+        with _DOCKER_SEM:
+            proc=subprocess.run(dcmd+["inspect","-f","{{.Id}}|{{.State.StartedAt}}",name],
+                                capture_output=True, text=True)
+        if proc.returncode!=0: return False, ""
+        out=proc.stdout.strip()
+        started=out.split("|",1)[1] if "|" in out else ""
+        # StartedAt is fixed-width RFC3339; slicing beats a throwaway regex
+        if len(started)>=19 and started[4]=='-' and started[10]=='T':
+            started=started[:19]
+        return True, started
+    except Exception: return False, ""
 
 # ------------------ time & parsing helpers ------------------
 TS_RGX = re.compile(r'\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+\-]\d{2}:\d{2})?')
 
-def _parse_rfc3339_any(ts):
-    if not ts: return None
-    t=ts.strip()
-    if t.endswith('Z'): t=t[:-1]+'+00:00'
-    m=re.match(r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})(?:\.(\d{1,9}))?(.*)', t)
-    if not m: return None
-    base, frac, rest = m.groups()
-    if frac: t=f"{base}.{(frac+'000000')[:6]}{rest}"
-    try: return datetime.fromisoformat(t).astimezone(timezone.utc)
-    except Exception: return None
-
-def pretty_local_ts(ts_raw, tz='America/New_York'):
+if sys.version_info >= (3, 11):
+    # 3.11's fromisoformat handles Z suffixes and long fractions directly
+    @functools.lru_cache(maxsize=4096)
+    def _parse_rfc3339_any(ts):
+        if not ts: return None
+        try: return datetime.fromisoformat(ts.strip()).astimezone(timezone.utc)
+        except Exception: return None
+else:
+    def _fast_rfc3339_utc(t):
+        # fixed-width slice parse for the dominant docker case (UTC, 'Z' or
+        # '+00:00'); sub-second digits are dropped, which the second-resolution
+        # pretty printer never shows anyway
+        if len(t)<19 or t[4]!='-' or t[13]!=':': return None
+        if not (t.endswith('Z') or t.endswith('+00:00')): return None
+        try:
+            return datetime(int(t[0:4]),int(t[5:7]),int(t[8:10]),
+                            int(t[11:13]),int(t[14:16]),int(t[17:19]),
+                            tzinfo=timezone.utc)
+        except ValueError:
+            return None
+
+    @functools.lru_cache(maxsize=4096)
+    def _parse_rfc3339_any(ts):
+        if not ts: return None
+        t=ts.strip()
+        dt=_fast_rfc3339_utc(t)
+        if dt is not None: return dt
+        if t.endswith('Z'): t=t[:-1]+'+00:00'
+        m=re.match(r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})(?:\.(\d{1,9}))?(.*)', t)
+        if not m: return None
+        base, frac, rest = m.groups()
+        if frac: t=f"{base}.{(frac+'000000')[:6]}{rest}"
+        try: return datetime.fromisoformat(t).astimezone(timezone.utc)
+        except Exception: return None
+
+try: _TZ=ZoneInfo('America/New_York')
+except Exception: _TZ=None
+
+_ANSI_RGX = re.compile(r'\x1b\[[0-9;]*m')
+def strip_ansi(logs):
+    # colored node logs bloat every downstream scan; the ESC memchr guard
+    # keeps the common uncolored case at a single byte scan
+    return _ANSI_RGX.sub('', logs) if '\x1b' in logs else logs
+
+def last_ts_in(logs):
+    # docker timestamps lead every line, so the last 4 KB always holds several;
+    # scanning just that slice avoids materializing every timestamp in the blob
+    if not logs: return None
+    last=None
+    for m in TS_RGX.finditer(logs[-4096:]): last=m
+    return last.group(0) if last else None
+
+# last_ts barely changes between polls, and inputs are pure -> memoize
+@functools.lru_cache(maxsize=4096)
+def pretty_local_ts(ts_raw, tz=_TZ):
     dt=_parse_rfc3339_any(ts_raw)
     if not dt: return ts_raw or 'N/A'
-    try: dt=dt.astimezone(ZoneInfo(tz))
-    except Exception: pass
+    if tz is not None:
+        try: dt=dt.astimezone(tz)
+        except Exception: pass
     return dt.strftime('%b %d, %Y %I:%M:%S %p %Z')
 
-def extract_max_int(patterns, text):
-    vals=[]
-    for pat in patterns:
-        for m in re.findall(pat, text, flags=re.I):
-            if isinstance(m, tuple):
-                m=[x for x in m if x]
-                m=m[-1] if m else ''
-            s=re.sub(r'[,\s]','',str(m))
-            d=re.search(r'(\d+)', s)
-            if d: vals.append(int(d.group(1)))
-    return max(vals) if vals else None
-
-def count_occurrences(pats, text):
-    return sum(len(re.findall(p, text, flags=re.I)) for p in pats)
-
-def derive_health_from_logs(logs):
+_STRIP_TBL = str.maketrans('', '', ', \t\n\r')
+def _to_int(s):
+    # single C-level pass; no regex engine for plain character deletion
+    s=str(s).translate(_STRIP_TBL)
+    return int(s) if s.isdigit() else None
+
+
+def count_literals(needles, low):
+    # str.count rides libc's SIMD substring search; docker log lines
+    # word-delimit these tokens naturally, so no boundary regex needed
+    return sum(low.count(n) for n in needles)
+
+# health/sync triggers are plain literals and docker log output already
+# word-delimits them, so vectorized substring scans beat the regex engine here;
+# both verdicts come from one lowercase pass with the shared screens reused
+def derive_health_and_sync(logs):
     if not logs:
-        return ("unclear", "❔ No logs")
-
-    err_hits = re.findall(r"\b(error|fatal|panic)\b", logs, re.I)
-    if len(err_hits) > 5:
-        return ("error", f"❌ Errors detected ({len(err_hits)}+)")
-
-    if re.search(r"\b(downloading blocks|sync(?:ing)?|catching up)\b", logs, re.I):
-        return ("syncing", "⏳ Syncing (downloading blocks)")
-    if re.search(r"\b(mined|mining|accepted|sealed)\b", logs, re.I):
-        return ("mining", "✅ Mining/processing activity")
-    if re.search(r"\bconnected\b|\bpeers?\b", logs, re.I):
-        return ("connected", "🔗 Connected to peers")
-    return ("unclear", "❔ Status unclear — check logs")
-
-def derive_sync_status(logs):
-    if re.search(r'error', logs, re.I): return "❌ Error"
-    if re.search(r'sync|downloading block', logs, re.I): return "⏳ Syncing"
-    if re.search(r'Imported new chain segment', logs, re.I): return "✅ Synced"
-    return "N/A"
+        return ("unclear", "❔ No logs"), "N/A"
+
+    low=logs.lower()
+    errors = low.count('error')
+    err_hits = errors + low.count('fatal') + low.count('panic')
+    syncing = 'sync' in low or 'downloading block' in low or 'catching up' in low
+
+    if err_hits > 5:
+        health=("error", f"❌ Errors detected ({err_hits}+)")
+    elif syncing:
+        health=("syncing", "⏳ Syncing (downloading blocks)")
+    elif 'mined' in low or 'sealed' in low or 'accepted' in low or 'mining' in low:
+        # ordered by hit rate in healthy node logs so the first scan usually lands
+        health=("mining", "✅ Mining/processing activity")
+    elif 'connected' in low or 'peer' in low:
+        health=("connected", "🔗 Connected to peers")
+    else:
+        health=("unclear", "❔ Status unclear — check logs")
+
+    if errors: sync="❌ Error"
+    elif syncing: sync="⏳ Syncing"
+    elif 'imported new chain segment' in low: sync="✅ Synced"
+    else: sync="N/A"
+    return health, sync
 
 # ------------------ docker logs ------------------
-def tail_logs(dcmd, container, since, tail):
-    cmd=dcmd+["logs","--timestamps"]
-    if since: cmd+=["--since", since]
-    cmd+=["--tail", str(tail), container]
-    try: return subprocess.check_output(cmd, stderr=subprocess.STDOUT, text=True)
-    except subprocess.CalledProcessError as e: return e.output or ""
-    except Exception: return ""
-
-def container_started_at(dcmd, name):
-    try:
-        out=subprocess.check_output(dcmd+["inspect","-f","{{.State.StartedAt}}",name], text=True).strip()
-        m=re.match(r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})', out)
-        return m.group(1) if m else (out or "")
-    except Exception: return ""
-
-def fetch_new_logs(dcmd, container, last_seen_ts):
-    # sensible caps
-    since = last_seen_ts if last_seen_ts else "1h"
-    tail  = "5000" if last_seen_ts else "10000"
-    try:
-        return subprocess.check_output(dcmd+["logs","--timestamps","--since",since,"--tail",tail,container],
-                                       stderr=subprocess.STDOUT, text=True)
-    except subprocess.CalledProcessError as e: return e.output or ""
-    except Exception: return ""
+# long-lived `docker logs -f` follower for the default container: one stream
+# instead of a fresh docker fork per poll, so steady-state work is only the
+# lines that arrived since the previous snapshot
+_FOLLOW_LOCK=threading.Lock()
+_FOLLOW_BUF=deque(maxlen=10000)
+_FOLLOW_TOTAL=[0]      # lines ever appended (survives deque eviction)
+_FOLLOW_CONSUMED=[0]   # lines already folded into the running totals
+_FOLLOW_ALIVE=[False]
+
+def _follow_loop(container):
+    dcmd=docker_cmd()
+    while True:
+        try:
+            p=subprocess.Popen(dcmd+["logs","-f","--timestamps","--since","10m",container],
+                               stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1<<20)
+            with _FOLLOW_LOCK:
+                _FOLLOW_BUF.clear()
+            _FOLLOW_ALIVE[0]=True
+            for line in p.stdout:
+                with _FOLLOW_LOCK:
+                    _FOLLOW_BUF.append(line); _FOLLOW_TOTAL[0]+=1
+        except Exception:
+            pass
+        finally:
+            _FOLLOW_ALIVE[0]=False
+        sleep(5)  # stream ended (container gone/restarted); retry
+
+def read_follow_window(live_tail, last_seen_ts=None):
+    # snapshot -> (lines new since last call, live window string), or None
+    # when the follower isn't running and the caller must fetch directly
+    if not _FOLLOW_ALIVE[0]: return None
+    with _FOLLOW_LOCK:
+        # consumed bookkeeping must share the lock: two concurrent consumers
+        # (poller + a cache-missing request) would otherwise both see the same
+        # new_n and double-count the delta into the totals
+        buf=list(_FOLLOW_BUF)
+        new_n=_FOLLOW_TOTAL[0]-_FOLLOW_CONSUMED[0]
+        _FOLLOW_CONSUMED[0]=_FOLLOW_TOTAL[0]
+    new_lines=buf[-new_n:] if new_n>0 else []
+    if last_seen_ts:
+        # startup backlog overlaps the persisted totals, and every reconnect
+        # replays up to 10m of already-counted lines (--since 10m); docker
+        # timestamps are uniform RFC3339, so a string compare dedups each batch
+        new_lines=[l for l in new_lines if l[:len(last_seen_ts)]>last_seen_ts]
+    return new_lines, ''.join(buf[-live_tail:] if live_tail>0 else [])
+
+def _last_line_ts(lines):
+    # only the newest timestamp matters; walk backwards and stop at the first hit
+    for line in reversed(lines):
+        m=TS_RGX.search(line)
+        if m: return m.group(0)
+    return None
+
+def scan_lines(lines):
+    # count over the joined batch, not line by line: one lowercase pass and
+    # six C-level str.count sweeps over contiguous memory instead of a Python
+    # loop iteration (with its own lower + dispatch) per line
+    if not lines:
+        return {"mined":0,"processed":0,"sealed":0}, None
+    low=''.join(lines).lower()
+    deltas={"mined":     count_literals(MINED_LITS, low),
+            "processed": count_literals(PROCESSED_LITS, low),
+            "sealed":    count_literals(SEALED_LITS, low)}
+    return deltas, _last_line_ts(lines)
+
+def fetch_and_scan(dcmd, container, last_seen_ts, since, live_tail):
+    # one docker logs pull serves both the running totals and the live window:
+    # the pull is sized for the window (--tail live_tail, honoring the user's
+    # since), and only lines newer than last_seen_ts fold into the counter
+    # deltas — the same timestamp string-compare the follower path uses.
+    # dedup must stay in-process: last_seen_ts is global and the poller
+    # advances it every ~2s, so passing it to --since would hand every other
+    # container a near-empty window
+    cmd=dcmd+["logs","--timestamps","--since",since or "10m","--tail",str(max(1,live_tail))]
+    deltas={"mined":0,"processed":0,"sealed":0}
+    last_ts=None
+    live=deque(maxlen=max(1, live_tail))
+    # hold the slot until the process is reaped, like the inspect path: the
+    # point is bounding live docker CLI processes, not just the spawn rate
+    with _DOCKER_SEM:
+        try:
+            p=subprocess.Popen(cmd+[container],
+                               stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1<<20)
+        except Exception:
+            return deltas, last_ts, ""
+        hs_stream=None
+        if _HS_DB is not None:
+            try: hs_stream=_HS_DB.stream(match_event_handler=_hs_on_match, context=deltas)
+            except Exception: hs_stream=None
+        try:
+            for line in p.stdout:
+                live.append(line)
+                if last_seen_ts and line[:len(last_seen_ts)]<=last_seen_ts:
+                    continue  # window line, but already folded into the totals
+                if hs_stream is not None:
+                    hs_stream.scan(line.encode('utf-8','replace'))
+                else:
+                    low=line.lower()
+                    deltas["mined"]     += count_literals(MINED_LITS, low)
+                    deltas["processed"] += count_literals(PROCESSED_LITS, low)
+                    deltas["sealed"]    += count_literals(SEALED_LITS, low)
+        except Exception:
+            pass
+        finally:
+            if hs_stream is not None:
+                try: hs_stream.close()
+                except Exception: pass
+            try: p.stdout.close()
+            except Exception: pass
+            try: p.wait(timeout=10)
+            except Exception:
+                # docker logs wedged past the deadline: reap it, don't leak it
+                try: p.kill(); p.wait(timeout=5)
+                except Exception: pass
+    # the stream's newest line is always in the live deque (maxlen >= 1)
+    last_ts=_last_line_ts(live)
+    return deltas, last_ts, ''.join(live)
 
 # ------------------ counters & peers ------------------
-MINED_PATS     = [r'\bmined\b', r'\bmining\s+completed\b']
-PROCESSED_PATS = [r'\bprocessed\b', r'\baccepted\b', r'\bapplied\b']
-SEALED_PATS    = [r'\bsealed\b', r'\bblock\s+sealed\b']
-HEIGHT_PATS    = [
-    r'(?:(?:height|best height|tip height|best|tip)[^0-9]*([0-9,]+))',
-    r'(?:(?:number|block[ _-]?number|blk|no\.)[^0-9]*([0-9,]+))',
-    r'\bheight=([0-9,]+)\b',
-    r'block\s+([0-9,]+)'
-]
-
-from time import time
-_PEERS_CACHE={'val':None,'ts':0.0}
+# one alternation per category -> one scan of the log instead of one per alternative
+MINED_RGX     = re.compile(r'\bmined\b|\bmining\s+completed\b', re.I)
+PROCESSED_RGX = re.compile(r'\bprocessed\b|\baccepted\b|\bapplied\b', re.I)
+SEALED_RGX    = re.compile(r'\bsealed\b', re.I)  # also covers "block sealed"
+# literal needles for the non-hyperscan counting path (lowercased input)
+MINED_LITS     = ('mined', 'mining completed')
+PROCESSED_LITS = ('processed', 'accepted', 'applied')
+SEALED_LITS    = ('sealed',)
+
+# optional hyperscan database: all counter categories matched in one JIT'd pass
+_HS_IDS = ("mined", "processed", "sealed")
+def _build_hs_db():
+    if hyperscan is None: return None
+    try:
+        db = hyperscan.Database()
+        db.compile(expressions=[MINED_RGX.pattern.encode(),
+                                PROCESSED_RGX.pattern.encode(),
+                                SEALED_RGX.pattern.encode()],
+                   ids=list(range(len(_HS_IDS))),
+                   flags=[hyperscan.HS_FLAG_CASELESS]*len(_HS_IDS))
+        return db
+    except Exception:
+        return None
+_HS_DB = _build_hs_db()
+
+def _hs_on_match(pat_id, start, end, flags, deltas):
+    deltas[_HS_IDS[pat_id]] += 1
+# all live-window extraction (peer counts, peer IDs, height) fused into one
+# alternation: a single finditer pass over the window instead of one scan per
+# pattern. Dispatch is on the named value group that matched; quantifiers stay
+# bounded as before. Timestamps keep their cheaper tail-slice search and the
+# running totals keep their streamed literal counts, so neither is in here.
+_LIVE_SCAN_PAT = (
+    r'\bpeers?\s{0,8}[:=]\s{0,8}(?P<peern1>[0-9,]+)\b'
+    r'|\bconnected\s{1,8}(?:to\s{1,8})?(?P<peern2>[0-9,]+)\s{1,8}peers?\b'
+    r'|\b(?:peer_count|peerCount|numPeers|num_peers)\s{0,8}[:=]\s{0,8}(?P<peern3>[0-9,]+)\b'
+    r'|["\'](?:peerCount|connectedPeers|peers)["\']\s{0,8}[:=]\s{0,8}(?P<peern4>[0-9,]+)\b'
+    # every height alternative lives in this one alternation; scan_live keeps a
+    # running max off the captured digit groups, so there is no per-pattern
+    # findall pass and no post-processing loop over match lists
+    r'|\b(?:height|best(?:\s+height)?|tip(?:\s+height)?)[^0-9]{0,20}(?P<height1>[0-9,]+)'
+    r'|\b(?:block[ _-]?number|block\s|number|blk|no\.)[^0-9]{0,20}(?P<height2>[0-9,]+)'
+    r'|peer(?:Id|ID)?=(?P<peerid1>[A-Za-z0-9:/._-]+)'
+    r'|(?:/p2p/|/ipfs/)(?P<peerid2>[A-Za-z0-9]+)')
+
+def _compile_live_scan(pattern):
+    # prefer RE2's linear-time DFA when installed, but only if the wrapper
+    # exposes the finditer/lastgroup API scan_live relies on
+    if re2 is not None:
+        try:
+            p=re2.compile(pattern, re2.IGNORECASE)
+            m=p.search('peers: 7')
+            if m is not None and m.lastgroup=='peern1':
+                return p
+        except Exception:
+            pass
+    return re.compile(pattern, re.I)
+
+_LIVE_SCAN_RGX = _compile_live_scan(_LIVE_SCAN_PAT)
+
+def scan_live(logs):
+    # one pass -> max peer count, max height, raw peer-ID hits
+    peers=-1; height=-1; ids=[]
+    for m in _LIVE_SCAN_RGX.finditer(logs):
+        lg=m.lastgroup
+        if lg is None: continue
+        if lg.startswith('peern'):
+            v=_to_int(m.group(lg))
+            if v is not None and v>peers: peers=v
+        elif lg.startswith('height'):
+            try: v=int(m.group(lg).replace(',',''))
+            except ValueError: continue
+            if v>height: height=v
+        else:
+            ids.append(m.group(lg))
+    return {"peers_max": peers if peers>=0 else None,
+            "height_max": height if height>=0 else None,
+            "peer_ids": ids}
+
+_PEERS_CACHE={}   # container -> (val, ts); keyed like the peer-table cache
 _PEERS_STALE=90.0
 
-def parse_peers(logs):
-    pats=[
-        r'\bpeers?\s*[:=]\s*([0-9,]+)\s*/\s*[0-9,]+\b',
-        r'\bconnected\s+(?:to\s+)?([0-9,]+)\s+peers?\b',
-        r'\b(?:peer_count|peerCount|numPeers|num_peers)\s*[:=]\s*([0-9,]+)\b',
-        r'["\'](?:peerCount|connectedPeers|peers)["\']\s*[:=]\s*([0-9,]+)\b',
-        r'\bpeers?\s*[:=]\s*([0-9,]+)\b',
-    ]
-    vals=[]
-    for pat in pats:
-        for m in re.findall(pat, logs, flags=re.I):
-            s=re.sub(r'[,\s]','',m)
-            if s.isdigit(): vals.append(int(s))
-    if vals: return max(vals)
+def parse_peers_from_scan(scan):
+    # the fused live-window pass already captured every numeric peer count
+    # (as a running max) and every raw peer-ID hit; consume those instead of
+    # running the old 7-pattern re-scan over the blob
+    if scan["peers_max"] is not None: return scan["peers_max"]
     # fallback: count unique IDs
-    ids=set()
-    for pat in [r'\bpeer(?:Id|ID)?=([A-Za-z0-9:/._-]+)', r'(?:/p2p/|/ipfs/)([A-Za-z0-9]+)']:
-        for pid in re.findall(pat, logs):
-            pid=pid.strip().rstrip('.,;')
-            if pid: ids.add(pid)
+    ids={pid.strip().rstrip('.,;') for pid in scan["peer_ids"]}
+    ids.discard('')
     return len(ids) if ids else None
 
-def parse_peer_list(logs, max_items=200):
-    ids=[]
-    for pat in [r'peer=([A-Za-z0-9:/._-]+)', r'(?:/p2p/|/ipfs/)([A-Za-z0-9]+)', r'peerId=([A-Za-z0-9]+)']:
-        ids += re.findall(pat, logs)
+def parse_peer_list(scan, max_items=200):
     cleaned=[]
-    for pid in ids:
+    for pid in scan["peer_ids"]:
         pid=(pid or '').strip().rstrip('.,;:[](){}')
         if len(pid)>=6: cleaned.append(pid)
-    counts={}
-    for pid in cleaned: counts[pid]=counts.get(pid,0)+1
-    items=sorted(counts.items(), key=lambda kv:(-kv[1], kv[0]))[:max_items]
+    items=Counter(cleaned).most_common(max_items)  # C-level tally + heap top-N
     out=[{"id": (pid[:7]+"…"+pid[-3:]) if len(pid)>14 else pid, "count": cnt, "full": pid} for pid,cnt in items]
     # numeric fallback row
     if not out:
-        num=parse_peers(logs)
+        num=parse_peers_from_scan(scan)
         if num: out=[{"id":"Connected peers","count": int(num), "full": str(num)}]
     return out
 
-def update_totals_from_logs(state, new_logs):
-    if not new_logs: return state
-    state["counters"]["mined"]     += count_occurrences(MINED_PATS, new_logs)
-    state["counters"]["processed"] += count_occurrences(PROCESSED_PATS, new_logs)
-    state["counters"]["sealed"]    += count_occurrences(SEALED_PATS, new_logs)
-    ts=TS_RGX.findall(new_logs)
-    if ts: state["last_seen_ts"]=ts[-1]
+# the peer table rows change slowly; rebuild at most every 30s and serve the
+# cached rows on intermediate polls. keyed by container so a non-default
+# query never inherits the default container's table
+_PEERS_LIST_CACHE={}   # container -> (rows, ts)
+_PEERS_LIST_TTL=30.0
+def peers_list_cached(container, scan):
+    hit=_PEERS_LIST_CACHE.get(container)
+    if hit and time()-hit[1]<=_PEERS_LIST_TTL: return hit[0]
+    rows=parse_peer_list(scan)
+    _PEERS_LIST_CACHE[container]=(rows, time())
+    return rows
+
+_STATE_LOCK=threading.Lock()
+def apply_scan(state, deltas, last_ts):
+    # += on a slot is not atomic; concurrent polls from gthread workers must
+    # not interleave the read-modify-write
+    with _STATE_LOCK:
+        state.mined     += deltas["mined"]
+        state.processed += deltas["processed"]
+        state.sealed    += deltas["sealed"]
+        if last_ts: state.last_seen_ts=last_ts
     return state
 
-# ------------------ routes ------------------
-@app.get("/api/status")
-def api_status():
-    import time as _t
-    now=_t.time()
-    if _RESP['json'] is not None and (now-_RESP['ts']<=_RESP_TTL):
-        return jsonify(_RESP['json'])
-
-    container=request.args.get("container","blockdag-testnet-network")
-    since=request.args.get("since","")
-    tail=int(request.args.get("tail","600"))
+# ------------------ status computation (shared by route + poller) ------------------
+_EX=ThreadPoolExecutor(max_workers=4)  # overlaps independent docker daemon RTTs
 
+def _compute_status(container, since, tail):
     dcmd=docker_cmd()
-    if not container_exists(dcmd, container):
-        return jsonify({"ok":False,"error":f"Container '{container}' not found."}),404
+    state=_STATE
+    # inspect and the log pull are independent docker calls; run them in
+    # parallel so the request costs the slower of the two, not the sum
+    inspect_f=_EX.submit(inspect_container, dcmd, container)
+    # the follower buffer is a fixed 10m stream; an explicit since must take
+    # effect, so those requests go through the direct fetch instead
+    win=read_follow_window(tail, state.last_seen_ts) if (container==DEFAULT_CONTAINER and not since) else None
+    fetch_f=None if win is not None else _EX.submit(fetch_and_scan, dcmd, container,
+                                                   state.last_seen_ts, since, tail)
+    exists, started_at=inspect_f.result()
+    if not exists:
+        if fetch_f is not None: fetch_f.result()  # reap; returns empties on error
+        return {"ok":False,"error":f"Container '{container}' not found."}, 404
+
+    if win is not None:
+        new_lines, live_logs=win
+        deltas, last_ts_seen=scan_lines(new_lines)
+    else:
+        deltas, last_ts_seen, live_logs=fetch_f.result()
+    live_logs=strip_ansi(live_logs)
+    state=apply_scan(state, deltas, last_ts_seen)
 
-    state=load_state()
-    new_logs=fetch_new_logs(dcmd, container, state.get("last_seen_ts"))
-    state=update_totals_from_logs(state, new_logs)
-    save_state(state)
+    (health_state, health_msg), sync_status = derive_health_and_sync(live_logs)
 
-    live_logs=tail_logs(dcmd, container, since, tail)
-    health_state, health_msg = derive_health_from_logs(live_logs)
-    sync_status=derive_sync_status(live_logs)
+    last_ts = last_ts_in(live_logs) or started_at or "N/A"
 
-    ts=TS_RGX.findall(live_logs)
-    last_ts = ts[-1] if ts else (container_started_at(dcmd, container) or "N/A")
+    scan=scan_live(live_logs)
 
     # peers numeric with short cache
-    pv=parse_peers(live_logs)
+    pv=parse_peers_from_scan(scan)
     _now=time()
     if pv and pv>0:
-        _PEERS_CACHE['val']=pv; _PEERS_CACHE['ts']=_now
+        _PEERS_CACHE[container]=(pv, _now)
         peers=str(pv)
     else:
-        if _PEERS_CACHE['val'] is not None and (_now-_PEERS_CACHE['ts']<=_PEERS_STALE):
-            peers=str(_PEERS_CACHE['val'])
+        hit=_PEERS_CACHE.get(container)
+        if hit and _now-hit[1]<=_PEERS_STALE:
+            peers=str(hit[0])
         else:
             peers="N/A" if pv is None else str(pv)
 
     # height live -> cache; else fallback to cached
-    height_val = extract_max_int(HEIGHT_PATS, live_logs)
+    height_val = scan["height_max"]
     height_stale=False
     if height_val is not None:
-        state["last_height"]=int(height_val)
-        save_state(state)
+        state.last_height=int(height_val)
     else:
-        if state.get("last_height") is not None:
-            height_val=int(state["last_height"]); height_stale=True
+        if state.last_height is not None:
+            height_val=int(state.last_height); height_stale=True
+    flush_state()  # one dirty mark per request covers counters + height
 
     resp={
         "ok": True,
@@ -246,21 +558,90 @@ def api_status():
         "last_log_time_raw": last_ts or "N/A",
         "last_log_time_local": pretty_local_ts(last_ts or ""),
         "peers": peers,
-        "peers_list": parse_peer_list(live_logs),
+        "peers_list": peers_list_cached(container, scan),
         "height": (str(height_val) if height_val is not None else "N/A"),
         "height_stale": height_stale,
-        "mined_total": state["counters"]["mined"],
-        "processed_total": state["counters"]["processed"],
-        "sealed_total": state["counters"]["sealed"],
+        "mined_total": state.mined,
+        "processed_total": state.processed,
+        "sealed_total": state.sealed,
         "since": since, "tail": tail, "container": container
     }
-    _RESP['json']=resp; _RESP['ts']=now
-    return jsonify(resp)
+    return resp, 200
+
+def _store_resp(key, resp):
+    # serialize + hash once at store time so cache hits skip jsonify and
+    # If-None-Match clients can skip the body entirely
+    ent={'json':resp,'ts':time(),'body':None,'etag':None,'body_nolist':None,'etag_nolist':None}
+    try:
+        ent['body']=_dumps_bytes(resp)
+        ent['etag']=hashlib.blake2b(ent['body'], digest_size=16).hexdigest()
+        ent['body_nolist']=_dumps_bytes({k:v for k,v in resp.items() if k!="peers_list"})
+        ent['etag_nolist']=hashlib.blake2b(ent['body_nolist'], digest_size=16).hexdigest()
+    except Exception:
+        pass
+    if len(_RESP_CACHE)>=_RESP_CACHE_MAX and key not in _RESP_CACHE:
+        _RESP_CACHE.clear()
+    _RESP_CACHE[key]=ent
+    return ent
+
+def _serve_entry(ent, want_list):
+    body=ent['body'] if want_list else ent['body_nolist']
+    etag=ent['etag'] if want_list else ent['etag_nolist']
+    if body is None:
+        return jsonify(ent['json'])
+    if etag and request.headers.get('If-None-Match')==etag:
+        return Response(status=304, headers={'ETag':etag})
+    return Response(body, mimetype='application/json',
+                    headers={'ETag':etag} if etag else None)
+
+def _poll_loop():
+    # keep the default-args response warm so /api/status never blocks on docker
+    while True:
+        try:
+            resp, code=_compute_status(*_DEFAULT_ARGS)
+            if code==200:
+                _store_resp(_DEFAULT_ARGS, resp)
+        except Exception:
+            pass
+        sleep(_POLL_INTERVAL)
+
+threading.Thread(target=_follow_loop, args=(DEFAULT_CONTAINER,), daemon=True).start()
+threading.Thread(target=_poll_loop, daemon=True).start()
+
+# ------------------ routes ------------------
+# docker accepts durations (10m) or RFC3339 stamps for --since; anything else
+# is dropped rather than forwarded to the CLI
+_SINCE_RGX=re.compile(r'\d{1,6}[smhd]|\d{4}-\d{2}-\d{2}(?:T\d{2}:\d{2}:\d{2}(?:Z|[+\-]\d{2}:\d{2})?)?')
+
+@app.get("/api/status")
+def api_status():
+    container=request.args.get("container",DEFAULT_CONTAINER)
+    since=request.args.get("since","")
+    # allow-list since and cap tail: a rogue ?tail=1000000 would make docker
+    # ship the whole log and every downstream scan chew on it
+    if since and not _SINCE_RGX.fullmatch(since): since=""
+    try: tail=int(request.args.get("tail","600") or 600)
+    except ValueError: tail=600
+    tail=min(max(tail,1),10000)
+    want_list=request.args.get("peers_list","1")!="0"
+
+    key=(container, since, tail)
+    ent=_RESP_CACHE.get(key)
+    if ent is not None and (time()-ent['ts']<=_RESP_TTL):
+        return _serve_entry(ent, want_list)
+
+    # cache miss (or stale): compute on demand and warm this key
+    resp, code=_compute_status(container, since, tail)
+    if code!=200:
+        return Response(_dumps_bytes(resp), mimetype='application/json'), code
+    return _serve_entry(_store_resp(key, resp), want_list)
 
 @app.post("/api/reset_totals")
 def api_reset_totals():
-    s=_state_default(); save_state(s)
-    _RESP['json']=None
+    _STATE.reset()
+    save_state(_STATE)
+    _RESP_CACHE.clear()
+    _INSPECT_CACHE.clear()
     return jsonify({"ok":True,"message":"Totals reset."})
 
 INDEX_HTML = """<!doctype html>
@@ -341,6 +722,7 @@ INDEX_HTML = """<!doctype html>
 
 <script>
 let timer=null;
+let pollN=0;
 
 function setHealth(state,msg){
   const el=document.getElementById('healthLine'); if(!el) return;
@@ -377,6 +759,8 @@ async function fetchStatus(){
   const since=document.getElementById('since').value.trim();
   const tail=document.getElementById('tail').value.trim()||"600";
   const qs=new URLSearchParams({container,tail}); if(since) qs.set("since", since);
+  // peer table changes slowly; ask for it on every 3rd poll only
+  qs.set("peers_list", (pollN++%3===0)?"1":"0");
   let res;
   try{
      res = await fetch("/api/status?"+qs.toString());
@@ -398,7 +782,7 @@ async function fetchStatus(){
   el('mined_total').textContent     = data.mined_total ?? 0;
   el('processed_total').textContent = data.processed_total ?? 0;
   el('sealed_total').textContent    = data.sealed_total ?? 0;
-  renderPeers(data.peers_list || [], data.peers);
+  if(Array.isArray(data.peers_list)) renderPeers(data.peers_list, data.peers);
 }
 
 function start(){ fetchStatus(); if(timer) clearInterval(timer); timer=setInterval(fetchStatus, 10000); }
@@ -409,9 +793,18 @@ window.addEventListener('load', start);
 </body>
 </html>
 """
+# encode (and gzip) the page once at import; per-hit work is a header check
+_INDEX_BYTES=INDEX_HTML.encode('utf-8')
+_INDEX_GZ=gzip.compress(_INDEX_BYTES, 9)
+
 @app.get("/")
 def index():
-    return Response(INDEX_HTML, mimetype="text/html")
+    if 'gzip' in request.headers.get('Accept-Encoding',''):
+        return Response(_INDEX_GZ, mimetype="text/html",
+                        headers={'Content-Encoding':'gzip','Vary':'Accept-Encoding'})
+    return Response(_INDEX_BYTES, mimetype="text/html")
 
 if __name__ == "__main__":
+    # dev convenience only — Werkzeug serializes requests on one thread.
+    # In production run: gunicorn -c gunicorn_conf.py app:app
     app.run(host="0.0.0.0", port=8080)
@@ -0,0 +1,12 @@
+# gunicorn -c gunicorn_conf.py app:app
+# /api/status is I/O-bound on the docker CLI, so threaded workers let
+# overlapping polls run in parallel instead of queueing behind one request.
+# Exactly one worker: totals, the response cache and the log follower live
+# in process memory, so a second worker would diverge from the first (and
+# undo /api/reset_totals when its flush loop rewrites .state.json). The 8
+# threads supply all the concurrency the dashboard needs.
+bind = "0.0.0.0:8080"
+workers = 1
+threads = 8
+worker_class = "gthread"
+timeout = 30